@@ -1,6 +1,7 @@
 """AI Analyzer - The brain of the trading bot"""
 import logging
-from datetime import datetime
+import math
+from bisect import bisect_left
 from typing import Dict, List, Optional
 import pandas as pd
 from openai import OpenAI
@@ -12,6 +13,16 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Signals indexed by [score > 0][level], level from _classify_score
+_SIGNAL_LADDER = (
+    (SignalStrength.NEUTRAL, SignalStrength.SELL, SignalStrength.STRONG_SELL),
+    (SignalStrength.NEUTRAL, SignalStrength.BUY, SignalStrength.STRONG_BUY),
+)
+
+# |score| above these thresholds -> (regular, strong) signal
+_TECHNICAL_THRESHOLDS = (0.2, 0.5)
+_DECISION_THRESHOLDS = (0.4, 1.2)
+
 
 class AIAnalyzer:
     """
@@ -89,7 +100,7 @@ class AIAnalyzer:
 
         # Step 6: Calculate trade parameters
         entry, stop_loss, take_profit, risk_reward = self._calculate_trade_params(
-            current_price, final_signal, market_data
+            current_price, final_signal, technical_signals.get('atr')
         )
 
         # Step 7: Generate summary and reasoning
@@ -171,16 +182,7 @@ class AIAnalyzer:
 
         if total_signals > 0:
             score = (buy_signals - sell_signals) / total_signals
-            if score > 0.5:
-                signal = SignalStrength.STRONG_BUY
-            elif score > 0.2:
-                signal = SignalStrength.BUY
-            elif score < -0.5:
-                signal = SignalStrength.STRONG_SELL
-            elif score < -0.2:
-                signal = SignalStrength.SELL
-            else:
-                signal = SignalStrength.NEUTRAL
+            signal = self._classify_score(score, _TECHNICAL_THRESHOLDS)
         else:
             signal = SignalStrength.NEUTRAL
 
@@ -470,16 +472,7 @@ Be direct and actionable. Focus on the most important factors."""
         avg_confidence = total_weight / len(signals) if signals else 0
 
         # Determine final signal
-        if avg_score > 1.2:
-            final_signal = SignalStrength.STRONG_BUY
-        elif avg_score > 0.4:
-            final_signal = SignalStrength.BUY
-        elif avg_score < -1.2:
-            final_signal = SignalStrength.STRONG_SELL
-        elif avg_score < -0.4:
-            final_signal = SignalStrength.SELL
-        else:
-            final_signal = SignalStrength.NEUTRAL
+        final_signal = self._classify_score(avg_score, _DECISION_THRESHOLDS)
 
         # Decide whether to trade
         # Not too strict - trade if confidence > 0.6 and signal is not neutral
@@ -491,26 +484,25 @@ Be direct and actionable. Focus on the most important factors."""
 
         return final_signal, avg_confidence, should_trade
 
+    @staticmethod
+    def _classify_score(score: float, thresholds: tuple) -> SignalStrength:
+        """Map a signed score to a signal using symmetric (regular, strong) thresholds"""
+        level = bisect_left(thresholds, abs(score))
+        return _SIGNAL_LADDER[1 if score > 0 else 0][level]
+
     def _calculate_trade_params(
         self,
         current_price: float,
         signal: SignalStrength,
-        market_data: pd.DataFrame
+        atr: Optional[float] = None
     ) -> tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
-        """Calculate entry, stop loss, and take profit"""
+        """Calculate entry, stop loss, and take profit from the ATR already in the technical signals"""
 
         if signal == SignalStrength.NEUTRAL:
             return None, None, None, None
 
-        # Calculate ATR for stop loss calculation
-        if len(market_data) >= 14:
-            high_low = market_data['high'] - market_data['low']
-            high_close = abs(market_data['high'] - market_data['close'].shift())
-            low_close = abs(market_data['low'] - market_data['close'].shift())
-            ranges = pd.concat([high_low, high_close, low_close], axis=1)
-            true_range = ranges.max(axis=1)
-            atr = true_range.rolling(14).mean().iloc[-1]
-        else:
+        # ATR for stop loss calculation
+        if atr is None or not math.isfinite(atr):
             # Fallback: use 1% of price
             atr = current_price * 0.01
 
@@ -3,10 +3,21 @@ import logging
 from typing import Optional, Dict, List
 import pandas as pd
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Typical spreads for major pairs (in pips)
+_TYPICAL_SPREADS = {
+    'EURUSD': 0.1,
+    'GBPUSD': 0.2,
+    'USDJPY': 0.1,
+    'USDCHF': 0.2,
+    'AUDUSD': 0.3,
+    'USDCAD': 0.2,
+    'NZDUSD': 0.4
+}
+
 
 class MarketDataFetcher:
     """
@@ -204,18 +215,7 @@ class MarketDataFetcher:
         Returns:
             Spread information
         """
-        # Typical spreads for major pairs (in pips)
-        typical_spreads = {
-            'EURUSD': 0.1,
-            'GBPUSD': 0.2,
-            'USDJPY': 0.1,
-            'USDCHF': 0.2,
-            'AUDUSD': 0.3,
-            'USDCAD': 0.2,
-            'NZDUSD': 0.4
-        }
-
-        spread = typical_spreads.get(symbol)
+        spread = _TYPICAL_SPREADS.get(symbol)
 
         if spread:
             return {
@@ -4,7 +4,6 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import requests
 from newsapi import NewsApiClient
-import re
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +78,8 @@ class NewsFetcher:
                 unique_articles.append(article)
 
         # Sort by date and limit
-        unique_articles.sort(key=lambda x: x.get('published_at', datetime.now()), reverse=True)
+        now = datetime.now()
+        unique_articles.sort(key=lambda x: x.get('published_at', now), reverse=True)
 
         return unique_articles[:max_articles]
 
@@ -93,7 +93,8 @@ class NewsFetcher:
         articles = []
 
         try:
-            from_date = (datetime.now() - timedelta(hours=hours_ago)).isoformat()
+            now = datetime.now()
+            from_date = (now - timedelta(hours=hours_ago)).isoformat()
 
             for query in queries[:2]:  # Limit queries to avoid rate limits
                 try:
@@ -115,7 +116,7 @@ class NewsFetcher:
                                 'source': article.get('source', {}).get('name', 'Unknown'),
                                 'published_at': datetime.fromisoformat(
                                     article.get('publishedAt', '').replace('Z', '+00:00')
-                                ) if article.get('publishedAt') else datetime.now(),
+                                ) if article.get('publishedAt') else now,
                                 'sentiment': self._analyze_sentiment_simple(
                                     article.get('title', '') + ' ' + article.get('description', '')
                                 )
@@ -137,8 +138,9 @@ class NewsFetcher:
             return articles
 
         try:
-            from_date = (datetime.now() - timedelta(hours=hours_ago)).strftime('%Y-%m-%d')
-            to_date = datetime.now().strftime('%Y-%m-%d')
+            now = datetime.now()
+            from_date = (now - timedelta(hours=hours_ago)).strftime('%Y-%m-%d')
+            to_date = now.strftime('%Y-%m-%d')
 
             url = f"https://finnhub.io/api/v1/news"
             params = {
@@ -183,7 +185,8 @@ class NewsFetcher:
         try:
             import feedparser
 
-            cutoff_time = datetime.now() - timedelta(hours=hours_ago)
+            now = datetime.now()
+            cutoff_time = now - timedelta(hours=hours_ago)
 
             for feed_url in rss_sources:
                 try:
@@ -191,7 +194,7 @@ class NewsFetcher:
 
                     for entry in feed.entries[:10]:
                         # Parse published date
-                        pub_date = datetime.now()
+                        pub_date = now
                         if hasattr(entry, 'published_parsed'):
                             pub_date = datetime(*entry.published_parsed[:6])
 
@@ -4,8 +4,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional
 import os
 from dotenv import load_dotenv
 import json
@@ -52,7 +53,8 @@ active_connections: List[WebSocket] = []
 # Trading state
 is_trading_active = False
 current_analyses = {}
-recent_trades = []
+recent_trades = deque(maxlen=100)  # Keep last 100 trades
+trading_task: Optional[asyncio.Task] = None
 
 
 class TradeRequest(BaseModel):
@@ -73,7 +75,7 @@ class ConfigUpdate(BaseModel):
 async def startup_event():
     """Initialize all components on startup"""
     global mt5_connector, ai_analyzer, news_fetcher, market_data_fetcher
-    global strategy_engine, risk_manager
+    global strategy_engine, risk_manager, trading_task
 
     logger.info("Starting AI Trading Bot...")
 
@@ -126,7 +128,7 @@ async def startup_event():
         logger.info("All components initialized successfully")
 
         # Start background task for auto-trading
-        asyncio.create_task(trading_loop())
+        trading_task = asyncio.create_task(trading_loop())
 
     except Exception as e:
         logger.error(f"Startup error: {str(e)}")
@@ -141,6 +143,14 @@ async def shutdown_event():
     logger.info("Shutting down AI Trading Bot...")
     is_trading_active = False
 
+    # Stop the trading loop before releasing MT5
+    if trading_task:
+        trading_task.cancel()
+        try:
+            await trading_task
+        except asyncio.CancelledError:
+            pass
+
     if mt5_connector:
         mt5_connector.disconnect()
 
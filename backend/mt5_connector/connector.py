@@ -1,16 +1,28 @@
 """MT5 Connector - Main interface for MetaTrader 5 operations"""
 import MetaTrader5 as mt5
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from datetime import datetime
+from typing import List, Optional
 import pandas as pd
 import logging
 from .models import (
     Trade, Position, TickData, OrderType, TradeStatus,
-    AccountInfo, TimeFrame, MarketData
+    AccountInfo, TimeFrame
 )
 
 logger = logging.getLogger(__name__)
 
+# Timeframe to MT5 constant
+_TIMEFRAME_MAP = {
+    TimeFrame.M1: mt5.TIMEFRAME_M1,
+    TimeFrame.M5: mt5.TIMEFRAME_M5,
+    TimeFrame.M15: mt5.TIMEFRAME_M15,
+    TimeFrame.M30: mt5.TIMEFRAME_M30,
+    TimeFrame.H1: mt5.TIMEFRAME_H1,
+    TimeFrame.H4: mt5.TIMEFRAME_H4,
+    TimeFrame.D1: mt5.TIMEFRAME_D1,
+    TimeFrame.W1: mt5.TIMEFRAME_W1
+}
+
 
 class MT5Connector:
     """
@@ -165,18 +177,7 @@ class MT5Connector:
 
         try:
             # Map timeframe to MT5 constant
-            tf_map = {
-                TimeFrame.M1: mt5.TIMEFRAME_M1,
-                TimeFrame.M5: mt5.TIMEFRAME_M5,
-                TimeFrame.M15: mt5.TIMEFRAME_M15,
-                TimeFrame.M30: mt5.TIMEFRAME_M30,
-                TimeFrame.H1: mt5.TIMEFRAME_H1,
-                TimeFrame.H4: mt5.TIMEFRAME_H4,
-                TimeFrame.D1: mt5.TIMEFRAME_D1,
-                TimeFrame.W1: mt5.TIMEFRAME_W1
-            }
-
-            mt5_timeframe = tf_map.get(timeframe, mt5.TIMEFRAME_H1)
+            mt5_timeframe = _TIMEFRAME_MAP.get(timeframe, mt5.TIMEFRAME_H1)
 
             # Get rates
             rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, 0, count)
@@ -1,8 +1,9 @@
 """Risk management for safe trading"""
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Optional
-from ..mt5_connector import MT5Connector, Position
+from ..mt5_connector import MT5Connector
+from ..mt5_connector.models import AccountInfo
 
 logger = logging.getLogger(__name__)
 
@@ -61,8 +62,11 @@ class RiskManager:
             logger.error("MT5 not connected")
             return False
 
+        # Fetch account state once and share it with the checks below
+        account_info = self.mt5.get_account_info()
+
         # Update daily tracking
-        self._update_daily_tracking()
+        self._update_daily_tracking(account_info)
 
         # Check max positions
         positions = self.mt5.get_open_positions()
@@ -77,12 +81,12 @@ class RiskManager:
                 return False
 
         # Check daily loss limit
-        if not self._check_daily_loss_limit():
+        if not self._check_daily_loss_limit(account_info):
             logger.warning("Daily loss limit reached")
             return False
 
         # Check max drawdown
-        if not self._check_max_drawdown():
+        if not self._check_max_drawdown(account_info):
             logger.warning("Max drawdown reached")
             return False
 
@@ -153,14 +157,15 @@ class RiskManager:
 
         return lots
 
-    def _update_daily_tracking(self):
+    def _update_daily_tracking(self, account_info: Optional[AccountInfo] = None):
         """Update daily tracking variables"""
         now = datetime.now()
+        if account_info is None:
+            account_info = self.mt5.get_account_info()
 
         # Reset daily tracking if new day
         if (self.daily_reset_time is None or
             now.date() > self.daily_reset_time.date()):
-            account_info = self.mt5.get_account_info()
             if account_info:
                 self.daily_start_balance = account_info.balance
                 self.daily_reset_time = now
@@ -168,13 +173,14 @@ class RiskManager:
                 logger.info(f"Daily tracking reset. Start balance: {self.daily_start_balance}")
 
         # Update peak balance for drawdown tracking
-        if account_info := self.mt5.get_account_info():
+        if account_info:
             if self.peak_balance is None or account_info.balance > self.peak_balance:
                 self.peak_balance = account_info.balance
 
-    def _check_daily_loss_limit(self) -> bool:
+    def _check_daily_loss_limit(self, account_info: Optional[AccountInfo] = None) -> bool:
         """Check if daily loss limit is reached"""
-        account_info = self.mt5.get_account_info()
+        if account_info is None:
+            account_info = self.mt5.get_account_info()
         if not account_info or not self.daily_start_balance:
             return True
 
@@ -189,9 +195,10 @@ class RiskManager:
 
         return True
 
-    def _check_max_drawdown(self) -> bool:
+    def _check_max_drawdown(self, account_info: Optional[AccountInfo] = None) -> bool:
         """Check if max drawdown is reached"""
-        account_info = self.mt5.get_account_info()
+        if account_info is None:
+            account_info = self.mt5.get_account_info()
         if not account_info or not self.peak_balance:
             return True
 
@@ -271,8 +278,8 @@ class RiskManager:
             # Check if can trade
             summary['can_trade'] = (
                 len(positions) < self.max_positions and
-                self._check_daily_loss_limit() and
-                self._check_max_drawdown()
+                self._check_daily_loss_limit(account_info) and
+                self._check_max_drawdown(account_info)
             )
 
         return summary
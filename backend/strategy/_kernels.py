@@ -0,0 +1,233 @@
+"""Compiled loop kernels backing the technical indicators"""
+import numpy as np
+from ._njit import njit
+
+
+@njit(cache=True, fastmath=True)
+def rsi_loop(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder-smoothed RSI in a single pass over the price array
+
+    Args:
+        prices: Contiguous float64 price array
+        period: RSI period
+
+    Returns:
+        RSI array (NaN until the first full period)
+    """
+    n = prices.shape[0]
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    # Seed averages with the mean of the first `period` deltas
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    total = avg_gain + avg_loss
+    if total > 0:
+        out[period] = 100.0 * avg_gain / total
+
+    # Wilder's smoothing for the rest of the series
+    for i in range(period + 1, n):
+        delta = prices[i] - prices[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        total = avg_gain + avg_loss
+        if total > 0:
+            out[i] = 100.0 * avg_gain / total
+
+    return out
+
+
+@njit(cache=True)
+def macd_loop(prices: np.ndarray, alpha_fast: float, alpha_slow: float, alpha_signal: float):
+    """
+    MACD line, signal line and histogram in a single pass
+
+    Args:
+        prices: Contiguous float64 price array
+        alpha_fast: Fast EMA smoothing factor (2 / (span + 1))
+        alpha_slow: Slow EMA smoothing factor
+        alpha_signal: Signal EMA smoothing factor
+
+    Returns:
+        Tuple of (MACD line, Signal line, Histogram) arrays
+    """
+    n = prices.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    histogram = np.empty(n)
+    if n == 0:
+        return macd, signal, histogram
+
+    ema_fast = prices[0]
+    ema_slow = prices[0]
+    ema_signal = 0.0
+    for i in range(n):
+        ema_fast += alpha_fast * (prices[i] - ema_fast)
+        ema_slow += alpha_slow * (prices[i] - ema_slow)
+        macd[i] = ema_fast - ema_slow
+        ema_signal += alpha_signal * (macd[i] - ema_signal)
+        signal[i] = ema_signal
+        histogram[i] = macd[i] - ema_signal
+
+    return macd, signal, histogram
+
+
+@njit(cache=True)
+def multi_ema(prices: np.ndarray, alphas: np.ndarray, out: np.ndarray):
+    """
+    Several EMAs of the same series in a single pass
+
+    Args:
+        prices: Contiguous float64 price array
+        alphas: Smoothing factor per EMA (2 / (span + 1))
+        out: Output array of shape (len(alphas), len(prices))
+    """
+    n = prices.shape[0]
+    k = alphas.shape[0]
+    if n == 0:
+        return
+
+    state = np.full(k, prices[0])
+    for i in range(n):
+        x = prices[i]
+        for j in range(k):
+            state[j] += alphas[j] * (x - state[j])
+            out[j, i] = state[j]
+
+
+@njit(cache=True)
+def multi_sma(prices: np.ndarray, windows: np.ndarray, out: np.ndarray):
+    """
+    Several simple moving averages of the same series in a single pass
+
+    Args:
+        prices: Contiguous float64 price array
+        windows: Window length per SMA
+        out: Output array of shape (len(windows), len(prices)),
+             NaN until each window is full
+    """
+    n = prices.shape[0]
+    k = windows.shape[0]
+    sums = np.zeros(k)
+    for i in range(n):
+        x = prices[i]
+        for j in range(k):
+            w = windows[j]
+            sums[j] += x
+            if i >= w:
+                sums[j] -= prices[i - w]
+            out[j, i] = sums[j] / w if i >= w - 1 else np.nan
+
+
+@njit(cache=True)
+def rolling_mean_std(prices: np.ndarray, window: int, mean: np.ndarray, std: np.ndarray):
+    """
+    Rolling mean and sample standard deviation (ddof=1) in a single pass
+
+    Args:
+        prices: Contiguous float64 price array
+        window: Window length
+        mean: Output array for the rolling mean, NaN until the window is full
+        std: Output array for the rolling standard deviation, NaN until the window is full
+    """
+    n = prices.shape[0]
+    base = prices[0] if n > 0 else 0.0
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        # Offsetting by the first price keeps the sum of squares small
+        x = prices[i] - base
+        s += x
+        ss += x * x
+        if i >= window:
+            old = prices[i - window] - base
+            s -= old
+            ss -= old * old
+        if i >= window - 1:
+            mean[i] = s / window + base
+            if window > 1:
+                var = (ss - s * s / window) / (window - 1)
+                std[i] = np.sqrt(var) if var > 0.0 else 0.0
+            else:
+                std[i] = np.nan
+        else:
+            mean[i] = np.nan
+            std[i] = np.nan
+
+
+@njit(cache=True)
+def rolling_max_min(high: np.ndarray, low: np.ndarray, window: int,
+                    out_max: np.ndarray, out_min: np.ndarray):
+    """
+    Rolling highest high and lowest low with monotonic deques, O(N) amortized
+
+    Args:
+        high: Contiguous float64 high prices
+        low: Contiguous float64 low prices
+        window: Window length
+        out_max: Output array for the rolling max of high, NaN until the window is full
+        out_min: Output array for the rolling min of low, NaN until the window is full
+    """
+    n = high.shape[0]
+    # Each index is pushed once, so flat arrays with head/tail cursors suffice
+    max_idx = np.empty(n, dtype=np.int64)
+    min_idx = np.empty(n, dtype=np.int64)
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+    for i in range(n):
+        while max_tail > max_head and high[max_idx[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_idx[max_tail] = i
+        max_tail += 1
+        if max_idx[max_head] <= i - window:
+            max_head += 1
+
+        while min_tail > min_head and low[min_idx[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_idx[min_tail] = i
+        min_tail += 1
+        if min_idx[min_head] <= i - window:
+            min_head += 1
+
+        if i >= window - 1:
+            out_max[i] = high[max_idx[max_head]]
+            out_min[i] = low[min_idx[min_head]]
+        else:
+            out_max[i] = np.nan
+            out_min[i] = np.nan
+
+
+@njit(cache=True)
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray):
+    """
+    True range in a single pass; the first bar has no previous close and uses high - low
+
+    Args:
+        high: Contiguous float64 high prices
+        low: Contiguous float64 low prices
+        close: Contiguous float64 close prices
+        out: Output array for the true range
+    """
+    n = high.shape[0]
+    if n == 0:
+        return
+    out[0] = high[0] - low[0]
+    for i in range(1, n):
+        prev_close = close[i - 1]
+        out[i] = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
@@ -1,8 +1,24 @@
 """Technical indicators calculator"""
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, Tuple
 import logging
+from ._kernels import (
+    rsi_loop, macd_loop, multi_ema, multi_sma, rolling_mean_std, rolling_max_min, true_range
+)
+from ._njit import HAS_NUMBA
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+# Optional: TA-Lib's C RSI/CCI match the formulas used here and are faster
+try:
+    import talib
+except ImportError:
+    talib = None
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +32,7 @@ class TechnicalIndicators:
     @staticmethod
     def calculate_rsi(data: pd.Series, period: int = 14) -> pd.Series:
         """
-        Calculate Relative Strength Index
+        Calculate Relative Strength Index (Wilder's smoothing)
 
         Args:
             data: Price data (usually close prices)
@@ -25,12 +41,39 @@ class TechnicalIndicators:
         Returns:
             RSI series
         """
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        prices = data.to_numpy(dtype=np.float64)
+        if talib is not None:
+            rsi = talib.RSI(prices, timeperiod=period)
+        elif HAS_NUMBA:
+            rsi = rsi_loop(prices, period)
+        else:
+            rsi = TechnicalIndicators._rsi_vectorized(prices, period)
+
+        return pd.Series(rsi, index=data.index)
+
+    @staticmethod
+    def _rsi_vectorized(prices: np.ndarray, period: int) -> np.ndarray:
+        """Wilder RSI using NumPy/pandas primitives (used when Numba is unavailable)"""
+        rsi = np.full(len(prices), np.nan)
+        if len(prices) <= period:
+            return rsi
+
+        delta = np.diff(prices)
+        gain = np.maximum(delta, 0.0)
+        loss = np.maximum(-delta, 0.0)
 
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        # Seed with the mean of the first `period` deltas, then Wilder's smoothing
+        gain_seq = gain[period - 1:].copy()
+        loss_seq = loss[period - 1:].copy()
+        gain_seq[0] = gain[:period].mean()
+        loss_seq[0] = loss[:period].mean()
+
+        alpha = 1.0 / period
+        avg_gain = pd.Series(gain_seq).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        avg_loss = pd.Series(loss_seq).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi[period:] = 100.0 * avg_gain / (avg_gain + avg_loss)
 
         return rsi
 
@@ -53,6 +96,19 @@ class TechnicalIndicators:
         Returns:
             Tuple of (MACD line, Signal line, Histogram)
         """
+        if HAS_NUMBA:
+            macd_line, signal_line, histogram = macd_loop(
+                data.to_numpy(dtype=np.float64),
+                2.0 / (fast + 1),
+                2.0 / (slow + 1),
+                2.0 / (signal + 1)
+            )
+            return (
+                pd.Series(macd_line, index=data.index),
+                pd.Series(signal_line, index=data.index),
+                pd.Series(histogram, index=data.index)
+            )
+
         ema_fast = data.ewm(span=fast, adjust=False).mean()
         ema_slow = data.ewm(span=slow, adjust=False).mean()
 
@@ -79,8 +135,17 @@ class TechnicalIndicators:
         Returns:
             Tuple of (Upper band, Middle band, Lower band)
         """
-        middle_band = data.rolling(window=period).mean()
-        std = data.rolling(window=period).std()
+        if HAS_NUMBA:
+            # Middle band and deviation share one pass over the prices
+            prices = data.to_numpy(dtype=np.float64)
+            mean = np.empty(len(prices))
+            deviation = np.empty(len(prices))
+            rolling_mean_std(prices, period, mean, deviation)
+            middle_band = pd.Series(mean, index=data.index)
+            std = pd.Series(deviation, index=data.index)
+        else:
+            middle_band = TechnicalIndicators._rolling_mean(data, period)
+            std = TechnicalIndicators._rolling_std(data, period)
 
         upper_band = middle_band + (std * std_dev)
         lower_band = middle_band - (std * std_dev)
@@ -101,14 +166,13 @@ class TechnicalIndicators:
         Returns:
             ATR series
         """
-        high_low = high - low
-        high_close = abs(high - close.shift())
-        low_close = abs(low - close.shift())
-
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
+        tr = TechnicalIndicators._true_range(
+            high.to_numpy(dtype=np.float64),
+            low.to_numpy(dtype=np.float64),
+            close.to_numpy(dtype=np.float64)
+        )
 
-        atr = true_range.rolling(window=period).mean()
+        atr = TechnicalIndicators._rolling_mean(pd.Series(tr, index=close.index), period)
 
         return atr
 
@@ -135,12 +199,11 @@ class TechnicalIndicators:
         Returns:
             Tuple of (%K, %D)
         """
-        lowest_low = low.rolling(window=period).min()
-        highest_high = high.rolling(window=period).max()
+        highest_high, lowest_low = TechnicalIndicators._rolling_max_min(high, low, period)
 
         k = 100 * ((close - lowest_low) / (highest_high - lowest_low))
-        k = k.rolling(window=smooth_k).mean()
-        d = k.rolling(window=smooth_d).mean()
+        k = TechnicalIndicators._rolling_mean(k, smooth_k)
+        d = TechnicalIndicators._rolling_mean(k, smooth_d)
 
         return k, d
 
@@ -163,13 +226,31 @@ class TechnicalIndicators:
         Returns:
             CCI series
         """
-        typical_price = (high + low + close) / 3
-        sma = typical_price.rolling(window=period).mean()
-        mean_deviation = typical_price.rolling(window=period).apply(
-            lambda x: np.abs(x - x.mean()).mean()
-        )
+        if talib is not None:
+            cci = talib.CCI(
+                high.to_numpy(dtype=np.float64),
+                low.to_numpy(dtype=np.float64),
+                close.to_numpy(dtype=np.float64),
+                timeperiod=period
+            )
+            return pd.Series(cci, index=close.index)
 
-        cci = (typical_price - sma) / (0.015 * mean_deviation)
+        typical_price = (high + low + close) / 3
+        tp = typical_price.to_numpy(dtype=np.float64)
+
+        cci = np.full(len(tp), np.nan)
+        if len(tp) >= period:
+            # One (N - period + 1, period) strided view, reduced row-wise
+            windows = sliding_window_view(tp, period)
+            window_mean = windows.mean(axis=1)
+            mean_deviation = np.abs(windows - window_mean[:, None]).mean(axis=1)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                valid = (tp[period - 1:] - window_mean) / (0.015 * mean_deviation)
+            # A flat window's mean can be one rounding step off the price, which
+            # would turn two rounding errors into a spurious +/-66.67
+            cci[period - 1:] = np.where(np.ptp(windows, axis=1) == 0, 0.0, valid)
+        cci = pd.Series(cci, index=typical_price.index)
 
         return cci
 
@@ -192,28 +273,36 @@ class TechnicalIndicators:
         Returns:
             ADX series
         """
+        h = high.to_numpy(dtype=np.float64)
+        l = low.to_numpy(dtype=np.float64)
+        c = close.to_numpy(dtype=np.float64)
+
+        # Previous-bar arrays, shifted once and shared below
+        prev_high = np.empty_like(h)
+        prev_low = np.empty_like(l)
+        prev_high[:1] = prev_low[:1] = np.nan
+        prev_high[1:] = h[:-1]
+        prev_low[1:] = l[:-1]
+
         # Calculate True Range
-        high_low = high - low
-        high_close = abs(high - close.shift())
-        low_close = abs(low - close.shift())
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
+        tr = TechnicalIndicators._true_range(h, l, c)
 
         # Calculate directional movement
-        up_move = high - high.shift()
-        down_move = low.shift() - low
+        up_move = h - prev_high
+        down_move = prev_low - l
 
-        pos_dm = up_move.where((up_move > down_move) & (up_move > 0), 0)
-        neg_dm = down_move.where((down_move > up_move) & (down_move > 0), 0)
+        pos_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        neg_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
 
         # Smooth the values
-        atr = true_range.rolling(window=period).mean()
-        pos_di = 100 * (pos_dm.rolling(window=period).mean() / atr)
-        neg_di = 100 * (neg_dm.rolling(window=period).mean() / atr)
+        index = close.index
+        atr = TechnicalIndicators._rolling_mean(pd.Series(tr, index=index), period)
+        pos_di = 100 * (TechnicalIndicators._rolling_mean(pd.Series(pos_dm, index=index), period) / atr)
+        neg_di = 100 * (TechnicalIndicators._rolling_mean(pd.Series(neg_dm, index=index), period) / atr)
 
         # Calculate DX and ADX
         dx = 100 * abs(pos_di - neg_di) / (pos_di + neg_di)
-        adx = dx.rolling(window=period).mean()
+        adx = TechnicalIndicators._rolling_mean(dx, period)
 
         return adx
 
@@ -235,21 +324,18 @@ class TechnicalIndicators:
             Dictionary with Ichimoku components
         """
         # Tenkan-sen (Conversion Line): (9-period high + 9-period low)/2
-        period9_high = high.rolling(window=9).max()
-        period9_low = low.rolling(window=9).min()
+        period9_high, period9_low = TechnicalIndicators._rolling_max_min(high, low, 9)
         tenkan_sen = (period9_high + period9_low) / 2
 
         # Kijun-sen (Base Line): (26-period high + 26-period low)/2
-        period26_high = high.rolling(window=26).max()
-        period26_low = low.rolling(window=26).min()
+        period26_high, period26_low = TechnicalIndicators._rolling_max_min(high, low, 26)
         kijun_sen = (period26_high + period26_low) / 2
 
         # Senkou Span A (Leading Span A): (Conversion Line + Base Line)/2
         senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(26)
 
         # Senkou Span B (Leading Span B): (52-period high + 52-period low)/2
-        period52_high = high.rolling(window=52).max()
-        period52_low = low.rolling(window=52).min()
+        period52_high, period52_low = TechnicalIndicators._rolling_max_min(high, low, 52)
         senkou_span_b = ((period52_high + period52_low) / 2).shift(26)
 
         # Chikou Span (Lagging Span): Close shifted back 26 periods
@@ -275,10 +361,21 @@ class TechnicalIndicators:
         Returns:
             Dictionary of moving averages
         """
+        if HAS_NUMBA:
+            # All SMAs and all EMAs each share one pass over the prices
+            prices = data.to_numpy(dtype=np.float64)
+            smas = np.empty((len(periods), len(prices)))
+            emas = np.empty((len(periods), len(prices)))
+            multi_sma(prices, np.asarray(periods, dtype=np.int64), smas)
+            multi_ema(prices, 2.0 / (np.asarray(periods, dtype=np.float64) + 1.0), emas)
+        else:
+            smas = [TechnicalIndicators._rolling_mean(data, period).to_numpy() for period in periods]
+            emas = [data.ewm(span=period, adjust=False).mean().to_numpy() for period in periods]
+
         mas = {}
-        for period in periods:
-            mas[f'sma_{period}'] = data.rolling(window=period).mean()
-            mas[f'ema_{period}'] = data.ewm(span=period, adjust=False).mean()
+        for period, sma, ema in zip(periods, smas, emas):
+            mas[f'sma_{period}'] = pd.Series(sma, index=data.index)
+            mas[f'ema_{period}'] = pd.Series(ema, index=data.index)
 
         return mas
 
@@ -367,48 +464,55 @@ class TechnicalIndicators:
             low = df['low']
             open_price = df['open']
 
+            # Read the last two bars once instead of per-field .iloc lookups
+            (prev_high, prev_low, prev_close), (_, _, current_price) = (
+                df[['high', 'low', 'close']].to_numpy()[-2:].tolist()
+            )
+
             # RSI
             rsi = TechnicalIndicators.calculate_rsi(close)
-            indicators['rsi'] = rsi.iloc[-1] if len(rsi) > 0 else 50
+            indicators['rsi'] = TechnicalIndicators._latest(rsi, 50)
             indicators['rsi_signal'] = TechnicalIndicators._rsi_signal(indicators['rsi'])
 
             # MACD
             macd, signal, histogram = TechnicalIndicators.calculate_macd(close)
-            indicators['macd'] = histogram.iloc[-1] if len(histogram) > 0 else 0
+            indicators['macd'] = TechnicalIndicators._latest(histogram, 0)
             indicators['macd_signal'] = 1 if indicators['macd'] > 0 else -1
 
             # Bollinger Bands
             bb_upper, bb_middle, bb_lower = TechnicalIndicators.calculate_bollinger_bands(close)
-            current_price = close.iloc[-1]
-            bb_position = (current_price - bb_lower.iloc[-1]) / (bb_upper.iloc[-1] - bb_lower.iloc[-1])
+            upper = TechnicalIndicators._latest(bb_upper)
+            lower = TechnicalIndicators._latest(bb_lower)
+            band_width = upper - lower
+            bb_position = (current_price - lower) / band_width if band_width else 0.5
             indicators['bb_position'] = bb_position
             indicators['bb_signal'] = TechnicalIndicators._bb_signal(bb_position)
 
             # ATR
             atr = TechnicalIndicators.calculate_atr(high, low, close)
-            indicators['atr'] = atr.iloc[-1] if len(atr) > 0 else 0
+            indicators['atr'] = TechnicalIndicators._latest(atr, 0)
 
             # Stochastic
             stoch_k, stoch_d = TechnicalIndicators.calculate_stochastic(high, low, close)
-            indicators['stochastic_k'] = stoch_k.iloc[-1] if len(stoch_k) > 0 else 50
+            indicators['stochastic_k'] = TechnicalIndicators._latest(stoch_k, 50)
             indicators['stochastic_signal'] = TechnicalIndicators._stochastic_signal(
                 indicators['stochastic_k']
             )
 
             # CCI
             cci = TechnicalIndicators.calculate_cci(high, low, close)
-            indicators['cci'] = cci.iloc[-1] if len(cci) > 0 else 0
+            indicators['cci'] = TechnicalIndicators._latest(cci, 0)
             indicators['cci_signal'] = TechnicalIndicators._cci_signal(indicators['cci'])
 
             # ADX
             adx = TechnicalIndicators.calculate_adx(high, low, close)
-            indicators['adx'] = adx.iloc[-1] if len(adx) > 0 else 0
+            indicators['adx'] = TechnicalIndicators._latest(adx, 0)
 
             # Moving Averages
             mas = TechnicalIndicators.calculate_moving_averages(close)
             for key, value in mas.items():
                 if len(value) > 0:
-                    indicators[key] = value.iloc[-1]
+                    indicators[key] = TechnicalIndicators._latest(value)
 
             # MA trend
             if 'sma_20' in indicators and 'sma_50' in indicators:
@@ -424,9 +528,6 @@ class TechnicalIndicators:
 
             # Pivot Points (using previous day's data)
             if len(df) > 1:
-                prev_high = df['high'].iloc[-2]
-                prev_low = df['low'].iloc[-2]
-                prev_close = df['close'].iloc[-2]
                 pivot_levels = TechnicalIndicators.calculate_pivot_points(
                     prev_high, prev_low, prev_close
                 )
@@ -448,6 +549,79 @@ class TechnicalIndicators:
 
         return indicators
 
+    @staticmethod
+    def _rolling_mean(data: pd.Series, period: int) -> pd.Series:
+        """Rolling mean using Bottleneck when installed, otherwise pandas"""
+        if bn is not None and len(data) >= period:
+            values = bn.move_mean(data.to_numpy(dtype=np.float64), period, min_count=period)
+            return pd.Series(values, index=data.index)
+
+        return data.rolling(window=period).mean()
+
+    @staticmethod
+    def _rolling_std(data: pd.Series, period: int) -> pd.Series:
+        """Rolling sample standard deviation (ddof=1), same as pandas rolling std"""
+        prices = data.to_numpy(dtype=np.float64)
+
+        if bn is not None and len(prices) >= period:
+            return pd.Series(
+                bn.move_std(prices, period, min_count=period, ddof=1),
+                index=data.index
+            )
+
+        std = np.full(len(prices), np.nan)
+        if period > 1 and len(prices) >= period:
+            # Window sums from cumulative sums; offsetting by the first price
+            # keeps the sum of squares small and limits cancellation error
+            shifted = prices - prices[0]
+            csum = np.concatenate(([0.0], np.cumsum(shifted)))
+            csum_sq = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+            window_sum = csum[period:] - csum[:-period]
+            window_sum_sq = csum_sq[period:] - csum_sq[:-period]
+
+            var = (window_sum_sq - window_sum * window_sum / period) / (period - 1)
+            std[period - 1:] = np.sqrt(np.maximum(var, 0.0))
+
+        return pd.Series(std, index=data.index)
+
+    @staticmethod
+    def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        """True range, using high - low on the first bar where there is no previous close"""
+        if HAS_NUMBA:
+            tr = np.empty(len(close))
+            true_range(high, low, close, tr)
+            return tr
+
+        prev_close = np.empty_like(close)
+        prev_close[:1] = np.nan
+        prev_close[1:] = close[:-1]
+        # fmax skips the missing first-bar previous close
+        return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+    @staticmethod
+    def _rolling_max_min(high: pd.Series, low: pd.Series, period: int) -> Tuple[pd.Series, pd.Series]:
+        """Rolling highest high and lowest low, computed together when Numba is installed"""
+        if HAS_NUMBA:
+            high_values = high.to_numpy(dtype=np.float64)
+            low_values = low.to_numpy(dtype=np.float64)
+            highest = np.empty(len(high_values))
+            lowest = np.empty(len(low_values))
+            rolling_max_min(high_values, low_values, period, highest, lowest)
+            return pd.Series(highest, index=high.index), pd.Series(lowest, index=low.index)
+
+        if bn is not None and len(high) >= period:
+            highest = bn.move_max(high.to_numpy(dtype=np.float64), period, min_count=period)
+            lowest = bn.move_min(low.to_numpy(dtype=np.float64), period, min_count=period)
+            return pd.Series(highest, index=high.index), pd.Series(lowest, index=low.index)
+
+        return high.rolling(window=period).max(), low.rolling(window=period).min()
+
+    @staticmethod
+    def _latest(series: pd.Series, default: float = np.nan) -> float:
+        """Last value of a series as a plain float"""
+        values = series.to_numpy()
+        return float(values[-1]) if len(values) > 0 else default
+
     @staticmethod
     def _rsi_signal(rsi: float) -> float:
         """Convert RSI to signal (-1 to 1)"""
@@ -1,7 +1,6 @@
 """Main strategy engine orchestrating the trading bot"""
 import logging
-from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import pandas as pd
 from ..mt5_connector import MT5Connector, Trade, OrderType, TimeFrame
 from ..ai_engine import AIAnalyzer, AnalysisResult
@@ -42,6 +41,9 @@ class StrategyEngine:
         self.market_data = market_data_fetcher
         self.indicators_calc = TechnicalIndicators()
 
+        # Last indicator result per (symbol, timeframe), keyed on the bar window
+        self._indicator_cache: Dict[Tuple[str, TimeFrame], Tuple[tuple, Dict]] = {}
+
     def analyze_symbol(
         self,
         symbol: str,
@@ -77,7 +79,7 @@ class StrategyEngine:
             current_price = tick.bid
 
             # Step 3: Calculate technical indicators
-            technical_signals = self.indicators_calc.calculate_all_indicators(market_data)
+            technical_signals = self._get_technical_signals(symbol, timeframe, market_data)
 
             # Step 4: Fetch news
             news_articles = self.news.get_forex_news(symbol, hours_ago=24, max_articles=20)
@@ -102,6 +104,38 @@ class StrategyEngine:
             logger.error(f"Error analyzing {symbol}: {str(e)}")
             return None
 
+    def _get_technical_signals(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        market_data: pd.DataFrame
+    ) -> Dict:
+        """
+        Calculate technical indicators, reusing the previous result if the bars are unchanged
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Chart timeframe
+            market_data: OHLCV DataFrame indexed by bar time
+
+        Returns:
+            Dictionary of all indicators and their signals
+        """
+        # Closed bars never change, so the window span plus the (possibly
+        # still forming) last bar identifies the indicator inputs
+        last_bar = market_data[['open', 'high', 'low', 'close']].to_numpy()[-1].tolist()
+        key = (len(market_data), market_data.index[0], market_data.index[-1], *last_bar)
+
+        cached = self._indicator_cache.get((symbol, timeframe))
+        if cached is not None and cached[0] == key:
+            logger.debug(f"Reusing technical indicators for {symbol} on {timeframe.value}")
+            return dict(cached[1])
+
+        signals = self.indicators_calc.calculate_all_indicators(market_data)
+        self._indicator_cache[(symbol, timeframe)] = (key, signals)
+
+        return dict(signals)
+
     def execute_analysis_trade(
         self,
         analysis: AnalysisResult,
@@ -1,7 +1,7 @@
 'use client'
 
 import { FileText, CheckCircle, XCircle, AlertCircle } from 'lucide-react'
-import { useEffect, useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { formatDistanceToNow } from 'date-fns'
 
 interface DecisionLogProps {
@@ -10,6 +10,7 @@ interface DecisionLogProps {
 }
 
 interface LogEntry {
+  id: number
   timestamp: Date
   type: 'analysis' | 'trade' | 'scan' | 'info'
   message: string
@@ -18,10 +19,12 @@ interface LogEntry {
 
 export function DecisionLog({ wsData, analyses }: DecisionLogProps) {
   const [logs, setLogs] = useState<LogEntry[]>([])
+  const nextLogId = useRef(0)
 
   useEffect(() => {
     if (wsData) {
       const newLog: LogEntry = {
+        id: nextLogId.current++,
         timestamp: new Date(),
         type: wsData.type || 'info',
         message: getLogMessage(wsData),
@@ -70,9 +73,9 @@ export function DecisionLog({ wsData, analyses }: DecisionLogProps) {
         {logs.length === 0 ? (
           <p className="text-gray-400 text-center py-4">Waiting for updates...</p>
         ) : (
-          logs.map((log, index) => (
+          logs.map((log) => (
             <div
-              key={index}
+              key={log.id}
               className="bg-gray-900 rounded-lg p-3 border border-gray-700 hover:border-gray-600 transition-colors"
             >
               <div className="flex items-start space-x-3">
@@ -7,6 +7,9 @@ echo   AI Trading Bot - Starting Up
 echo ===================================
 echo.
 
+REM Set BOT_SKIP_PREFLIGHT=1 to skip tool and dependency checks on a verified install
+if "%BOT_SKIP_PREFLIGHT%"=="1" goto skip_tool_checks
+
 REM Check if Python is installed
 python --version >nul 2>&1
 if errorlevel 1 (
@@ -27,6 +30,7 @@ if errorlevel 1 (
 
 echo [OK] Python and Node.js found
 echo.
+:skip_tool_checks
 
 REM Check if backend/.env exists
 if not exist "backend\.env" (
@@ -45,6 +49,8 @@ if not exist "frontend\.env.local" (
     echo NEXT_PUBLIC_WS_URL=ws://localhost:8000/ws >> frontend\.env.local
 )
 
+if "%BOT_SKIP_PREFLIGHT%"=="1" goto skip_dependency_checks
+
 REM Install backend dependencies if needed
 if not exist "backend\.dependencies_installed" (
     echo Installing backend dependencies...
@@ -65,6 +71,7 @@ if not exist "frontend\node_modules" (
     echo [OK] Frontend dependencies installed
     echo.
 )
+:skip_dependency_checks
 
 echo ===================================
 echo   Starting Services...
@@ -79,8 +86,8 @@ echo.
 REM Start backend in a new window
 start "AI Trading Bot - Backend" /D "%CD%\backend" cmd /k "python main.py"
 
-REM Wait a bit for backend to start
-timeout /t 3 /nobreak >nul
+REM Wait for backend to accept connections (max 15 seconds)
+powershell -NoProfile -Command "$deadline = (Get-Date).AddSeconds(15); while ((Get-Date) -lt $deadline) { $c = New-Object Net.Sockets.TcpClient; try { if ($c.ConnectAsync('127.0.0.1', 8000).Wait(100)) { exit 0 } } catch { } finally { $c.Dispose() }; Start-Sleep -Milliseconds 50 }" >nul 2>&1
 
 REM Start frontend in a new window
 start "AI Trading Bot - Frontend" /D "%CD%\frontend" cmd /k "npm run dev"
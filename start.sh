@@ -14,22 +14,25 @@ GREEN='\033[0;32m'
 YELLOW='\033[1;33m'
 NC='\033[0m' # No Color
 
-# Check if Python is installed
-if ! command -v python3 &> /dev/null; then
-    echo -e "${RED}Error: Python 3 is not installed${NC}"
-    echo "Please install Python 3.10+ from https://www.python.org/downloads/"
-    exit 1
-fi
+# Set BOT_SKIP_PREFLIGHT=1 to skip tool and dependency checks on a verified install
+if [ "$BOT_SKIP_PREFLIGHT" != "1" ]; then
+    # Check if Python is installed
+    if ! command -v python3 &> /dev/null; then
+        echo -e "${RED}Error: Python 3 is not installed${NC}"
+        echo "Please install Python 3.10+ from https://www.python.org/downloads/"
+        exit 1
+    fi
 
-# Check if Node.js is installed
-if ! command -v node &> /dev/null; then
-    echo -e "${RED}Error: Node.js is not installed${NC}"
-    echo "Please install Node.js 18+ from https://nodejs.org/"
-    exit 1
-fi
+    # Check if Node.js is installed
+    if ! command -v node &> /dev/null; then
+        echo -e "${RED}Error: Node.js is not installed${NC}"
+        echo "Please install Node.js 18+ from https://nodejs.org/"
+        exit 1
+    fi
 
-echo -e "${GREEN}✓ Python and Node.js found${NC}"
-echo ""
+    echo -e "${GREEN}✓ Python and Node.js found${NC}"
+    echo ""
+fi
 
 # Check if backend/.env exists
 if [ ! -f "backend/.env" ]; then
@@ -47,25 +50,27 @@ if [ ! -f "frontend/.env.local" ]; then
     echo "NEXT_PUBLIC_WS_URL=ws://localhost:8000/ws" >> frontend/.env.local
 fi
 
-# Install backend dependencies if needed
-if [ ! -d "backend/__pycache__" ] || [ ! -f "backend/.dependencies_installed" ]; then
-    echo -e "${YELLOW}Installing backend dependencies...${NC}"
-    cd backend
-    pip3 install -r requirements.txt
-    touch .dependencies_installed
-    cd ..
-    echo -e "${GREEN}✓ Backend dependencies installed${NC}"
-    echo ""
-fi
+if [ "$BOT_SKIP_PREFLIGHT" != "1" ]; then
+    # Install backend dependencies if needed
+    if [ ! -d "backend/__pycache__" ] || [ ! -f "backend/.dependencies_installed" ]; then
+        echo -e "${YELLOW}Installing backend dependencies...${NC}"
+        cd backend
+        pip3 install -r requirements.txt
+        touch .dependencies_installed
+        cd ..
+        echo -e "${GREEN}✓ Backend dependencies installed${NC}"
+        echo ""
+    fi
 
-# Install frontend dependencies if needed
-if [ ! -d "frontend/node_modules" ]; then
-    echo -e "${YELLOW}Installing frontend dependencies...${NC}"
-    cd frontend
-    npm install
-    cd ..
-    echo -e "${GREEN}✓ Frontend dependencies installed${NC}"
-    echo ""
+    # Install frontend dependencies if needed
+    if [ ! -d "frontend/node_modules" ]; then
+        echo -e "${YELLOW}Installing frontend dependencies...${NC}"
+        cd frontend
+        npm install
+        cd ..
+        echo -e "${GREEN}✓ Frontend dependencies installed${NC}"
+        echo ""
+    fi
 fi
 
 echo -e "${GREEN}==================================="
@@ -94,8 +99,15 @@ python3 main.py &
 BACKEND_PID=$!
 cd ..
 
-# Wait a bit for backend to start
-sleep 3
+# Wait for backend to accept connections (max 15 seconds)
+for _ in $(seq 1 300); do
+    if (echo > /dev/tcp/127.0.0.1/8000) 2>/dev/null; then
+        break
+    fi
+    # Stop waiting if the backend exited during startup
+    kill -0 $BACKEND_PID 2>/dev/null || break
+    sleep 0.05
+done
 
 # Start frontend in background
 cd frontend